@@ -1,20 +1,51 @@
 from __future__ import annotations
 
 import argparse
+import functools
+import logging
 import os
-import sys
+import re
+import threading
 import time
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
 
 WINDOW_NAME = "Webcam Feed"
 CAPTURE_WIDTH = 1920
 CAPTURE_HEIGHT = 1080
 CAPTURE_FPS = 30
+CAPTURE_BUFFER_SIZE = 1
 WINDOW_DEFAULT_WIDTH = 1280
 WINDOW_DEFAULT_HEIGHT = 720
 STARTUP_READ_ATTEMPTS = 10
-STARTUP_READ_DELAY_SECONDS = 0.02
+STARTUP_READ_BASE_DELAY_SECONDS = 0.002
+STARTUP_READ_MAX_DELAY_SECONDS = 1.0 / CAPTURE_FPS
+IDLE_POLL_DELAY_SECONDS = 0.001
+# Stale-frame limits are in periods of the measured frame interval, so a
+# source slower than CAPTURE_FPS is not mistaken for a stalled one.
+STALE_FRAME_GAP_PERIODS = 1.5
+FRESH_GRAB_MIN_PERIODS = 0.5
+FRAME_INTERVAL_SMOOTHING = 0.125
+MAX_STALE_GRABS = 4
+
+_QUIT_KEY = ord("q")
+
+_DEV_VIDEO_RE = re.compile(r"/dev/video(\d+)")
+_DIGITS_RE = re.compile(r"\d+")
+
+# Same packing as cv2.VideoWriter_fourcc("M", "J", "P", "G").
+_MJPG_FOURCC = ord("M") | (ord("J") << 8) | (ord("P") << 16) | (ord("G") << 24)
+
+_DEFAULT_CAPTURE_PROPERTIES: tuple[tuple[str, float], ...] = (
+    ("CAP_PROP_FRAME_WIDTH", float(CAPTURE_WIDTH)),
+    ("CAP_PROP_FRAME_HEIGHT", float(CAPTURE_HEIGHT)),
+    ("CAP_PROP_FPS", float(CAPTURE_FPS)),
+    ("CAP_PROP_BUFFERSIZE", float(CAPTURE_BUFFER_SIZE)),
+    ("CAP_PROP_FOURCC", float(_MJPG_FOURCC)),
+)
+_DEFAULT_CAPTURE_PROPERTY_NAMES = tuple(name for name, _ in _DEFAULT_CAPTURE_PROPERTIES)
 
 
 class CameraError(Exception):
@@ -28,52 +59,127 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
         default="0",
         help="Camera source index (e.g. 0) or video path/URL. Defaults to 0.",
     )
+    parser.add_argument(
+        "--no-convert-rgb",
+        action="store_true",
+        help=(
+            "Hand raw frames through without converting them to BGR and decode "
+            "only the frames that are shown (useful for MJPG sources)."
+        ),
+    )
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="Read frames without opening a window, e.g. to benchmark capture.",
+    )
+    parser.add_argument(
+        "--max-frames",
+        type=_positive_int,
+        default=None,
+        help="Stop after reading this many frames. Defaults to no limit.",
+    )
     return parser.parse_args(argv)
 
 
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"expected a positive integer, got {value}")
+    return number
+
+
 def normalize_camera_source(camera_source: str | int) -> int | str:
     if isinstance(camera_source, int):
         return camera_source
     stripped = camera_source.strip()
-    if stripped.startswith("/dev/video"):
-        suffix = stripped.removeprefix("/dev/video")
-        if suffix.isdigit():
-            return int(suffix)
-    if stripped.isdigit():
+    match = _DEV_VIDEO_RE.fullmatch(stripped)
+    if match:
+        return int(match.group(1))
+    if _DIGITS_RE.fullmatch(stripped):
         return int(stripped)
     return stripped
 
 
+def is_camera_device(source: int | str) -> bool:
+    return isinstance(source, int) or source.startswith("/dev/video")
+
+
 def open_capture(source: int | str, cv2_module: Any) -> Any:
+    capture, _ = _open_capture(source, cv2_module, None)
+    return capture
+
+
+def open_capture_with_params(
+    source: int | str, cv2_module: Any, params: list[int]
+) -> tuple[Any, bool]:
+    """Open the capture with ``params`` applied by the backend before streaming.
+
+    Returns the capture and whether the parameters were passed at open time.
+    Each candidate falls back to a plain open when the bindings lack the
+    params overload (OpenCV < 4.5.2) or the backend rejects the parameters.
+    """
+    if not params or not hasattr(cv2_module, "CAP_ANY"):
+        return open_capture(source, cv2_module), False
+    return _open_capture(source, cv2_module, params)
+
+
+def _open_capture(
+    source: int | str, cv2_module: Any, params: list[int] | None
+) -> tuple[Any, bool]:
     attempts: list[tuple[int | str, int | None, str]] = [(source, None, "default")]
     if isinstance(source, int):
         attempts.append((f"/dev/video{source}", None, "dev-path"))
+    # Old bindings raise TypeError for an unknown overload; newer ones and the
+    # backends themselves raise cv2.error.
+    binding_errors = (TypeError, getattr(cv2_module, "error", TypeError))
 
-    seen: set[tuple[str, int | None]] = set()
+    seen: set[tuple[type, int | str, int | None]] = set()
     attempted_labels: list[str] = []
     for candidate_source, backend, label in attempts:
-        dedupe_key = (repr(candidate_source), backend)
+        # Include the type so that e.g. 0 and "0" stay distinct attempts.
+        dedupe_key = (type(candidate_source), candidate_source, backend)
         if dedupe_key in seen:
             continue
         seen.add(dedupe_key)
-        attempted_labels.append(label)
 
-        capture = (
-            cv2_module.VideoCapture(candidate_source)
-            if backend is None
-            else cv2_module.VideoCapture(candidate_source, backend)
-        )
+        if params:
+            attempted_labels.append(f"{label}+params")
+            try:
+                capture = cv2_module.VideoCapture(
+                    candidate_source,
+                    cv2_module.CAP_ANY if backend is None else backend,
+                    params,
+                )
+            except binding_errors:
+                capture = None
+            if capture and capture.isOpened():
+                return capture, True
+            if capture:
+                capture.release()
+
+        attempted_labels.append(label)
+        if backend is None:
+            capture = cv2_module.VideoCapture(candidate_source)
+        else:
+            capture = cv2_module.VideoCapture(candidate_source, backend)
         if capture and capture.isOpened():
-            return capture
+            return capture, False
         if capture:
             capture.release()
 
     extra_hint = ""
-    if isinstance(source, str) and source.startswith("/dev/video"):
-        if not Path(source).exists():
-            extra_hint = " Device path does not exist."
-        elif not os.access(source, os.R_OK | os.W_OK):
+    # Check access first: a device that exists and is accessible (e.g. busy)
+    # is the common failure and needs a single syscall. os.access is used
+    # instead of st_mode bits so ACL-granted access (logind) is honoured.
+    if (
+        isinstance(source, str)
+        and source.startswith("/dev/video")
+        and not os.access(source, os.R_OK | os.W_OK)
+    ):
+        if Path(source).exists():
             extra_hint = " Permission denied for camera device."
+        else:
+            extra_hint = " Device path does not exist."
 
     raise CameraError(
         f"Unable to open camera source: {source}. "
@@ -81,31 +187,62 @@ def open_capture(source: int | str, cv2_module: Any) -> Any:
     )
 
 
+def capture_default_params(cv2_module: Any) -> list[int]:
+    property_ids = _resolve_prop_ids(cv2_module, _DEFAULT_CAPTURE_PROPERTY_NAMES)
+    params: list[int] = []
+    for property_name, property_value in _DEFAULT_CAPTURE_PROPERTIES:
+        property_id = property_ids.get(property_name)
+        if property_id is not None:
+            params.extend((property_id, int(property_value)))
+    return params
+
+
+def _startup_delay(attempt: int) -> float:
+    # Back off exponentially so fast cameras start quickly, but never wait
+    # longer than one frame period between attempts.
+    return min(
+        STARTUP_READ_BASE_DELAY_SECONDS * (1 << attempt),
+        STARTUP_READ_MAX_DELAY_SECONDS,
+    )
+
+
 def read_initial_frame(capture: Any) -> tuple[bool, Any]:
+    grab = capture.grab
+    retrieve = capture.retrieve
     for attempt in range(STARTUP_READ_ATTEMPTS):
-        ok, frame = capture.read()
-        if ok:
-            return True, frame
+        if grab():
+            ok, frame = retrieve()
+            if ok:
+                return True, frame
         if attempt < STARTUP_READ_ATTEMPTS - 1:
-            time.sleep(STARTUP_READ_DELAY_SECONDS)
+            time.sleep(_startup_delay(attempt))
     return False, None
 
 
-def set_capture_property(
-    capture: Any, cv2_module: Any, property_name: str, property_value: float
-) -> None:
-    if not hasattr(cv2_module, property_name):
-        return
+@functools.cache
+def _resolve_prop_ids(cv2_module: Any, names: tuple[str, ...]) -> dict[str, int]:
+    return {
+        name: int(getattr(cv2_module, name))
+        for name in names
+        if hasattr(cv2_module, name)
+    }
+
 
-    property_id = int(getattr(cv2_module, property_name))
-    set_ok = bool(capture.set(property_id, property_value))
+def _set_prop_id(
+    set_property: Callable[[int, float], Any],
+    get_property: Callable[[int], Any] | None,
+    property_id: int,
+    property_value: float,
+    property_name: str,
+) -> None:
+    set_ok = bool(set_property(property_id, property_value))
     if set_ok:
         return
 
     actual_value: float | None = None
-    if hasattr(capture, "get"):
+    if get_property is not None:
         try:
-            raw_value = capture.get(property_id)
+            raw_value = get_property(property_id)
             if isinstance(raw_value, (int, float)):
                 actual_value = float(raw_value)
         except Exception:
@@ -121,32 +258,258 @@ def set_capture_property(
     if matches_requested:
         return
 
-    actual_suffix = f" (actual={actual_value})" if actual_value is not None else ""
-    print(
-        (
-            "Warning: OpenCV ignored default capture setting "
-            f"{property_name}={property_value}.{actual_suffix}"
-        ),
-        file=sys.stderr,
+    if actual_value is None:
+        logger.warning(
+            "OpenCV ignored default capture setting %s=%s.",
+            property_name,
+            property_value,
+        )
+    else:
+        logger.warning(
+            "OpenCV ignored default capture setting %s=%s. (actual=%s)",
+            property_name,
+            property_value,
+            actual_value,
+        )
+
+
+def set_capture_property(
+    capture: Any, cv2_module: Any, property_name: str, property_value: float
+) -> None:
+    property_id = _resolve_prop_ids(cv2_module, (property_name,)).get(property_name)
+    if property_id is None:
+        return
+    _set_prop_id(
+        capture.set,
+        getattr(capture, "get", None),
+        property_id,
+        property_value,
+        property_name,
     )
 
 
+def read_capture_properties(capture: Any, cv2_module: Any) -> dict[str, float]:
+    get_property = getattr(capture, "get", None)
+    if get_property is None:
+        return {}
+
+    property_ids = _resolve_prop_ids(cv2_module, _DEFAULT_CAPTURE_PROPERTY_NAMES)
+    properties: dict[str, float] = {}
+    for property_name, property_id in property_ids.items():
+        try:
+            raw_value = get_property(property_id)
+        except Exception:
+            continue
+        # OpenCV reports 0 for properties the backend does not support.
+        if isinstance(raw_value, (int, float)) and raw_value != 0:
+            properties[property_name] = float(raw_value)
+    return properties
+
+
+def reset_capture_properties(
+    capture: Any, cv2_module: Any, properties: dict[str, float]
+) -> None:
+    property_ids = _resolve_prop_ids(cv2_module, _DEFAULT_CAPTURE_PROPERTY_NAMES)
+    set_property = capture.set
+    get_property = getattr(capture, "get", None)
+    for property_name, property_value in properties.items():
+        property_id = property_ids.get(property_name)
+        if property_id is not None:
+            _set_prop_id(
+                set_property, get_property, property_id, property_value, property_name
+            )
+
+
 def apply_capture_defaults(capture: Any, cv2_module: Any) -> None:
-    set_capture_property(
-        capture, cv2_module, "CAP_PROP_FRAME_WIDTH", float(CAPTURE_WIDTH)
-    )
-    set_capture_property(
-        capture, cv2_module, "CAP_PROP_FRAME_HEIGHT", float(CAPTURE_HEIGHT)
-    )
-    set_capture_property(capture, cv2_module, "CAP_PROP_FPS", float(CAPTURE_FPS))
+    property_ids = _resolve_prop_ids(cv2_module, _DEFAULT_CAPTURE_PROPERTY_NAMES)
+    set_property = capture.set
+    get_property = getattr(capture, "get", None)
+    for property_name, property_value in _DEFAULT_CAPTURE_PROPERTIES:
+        property_id = property_ids.get(property_name)
+        if property_id is not None:
+            _set_prop_id(
+                set_property, get_property, property_id, property_value, property_name
+            )
 
-    if hasattr(cv2_module, "CAP_PROP_FOURCC") and hasattr(
-        cv2_module, "VideoWriter_fourcc"
-    ):
-        default_fourcc = cv2_module.VideoWriter_fourcc("M", "J", "P", "G")
-        set_capture_property(
-            capture, cv2_module, "CAP_PROP_FOURCC", float(default_fourcc)
-        )
+
+class _CaptureThread(threading.Thread):
+    """Drains the capture continuously and hands out fresh frames on demand.
+
+    Every frame is grabbed, but a frame is only decoded with retrieve() right
+    after the grab that follows a take() finding the slot empty, so grabbed
+    frames nobody will display are never decoded and a handed-out frame is
+    never one decoded before the consumer asked. Frames the driver queued
+    while the loop was stalled are skipped before they are decoded. Frames are
+    decoded into two alternating buffers: demand is only signalled once the
+    consumer is done with its previous frame, so the older buffer can be
+    reused.
+    """
+
+    def __init__(
+        self,
+        capture: Any,
+        spare_frame: Any = None,
+        frame_interval: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        super().__init__(name="inno-capture", daemon=True)
+        self._capture = capture
+        self._clock = clock
+        # grab() does not block on video files, so they are paced to their
+        # own frame rate instead of being read through at full speed.
+        self._frame_interval = frame_interval
+        self._buffers: list[Any] = [None, spare_frame]
+        self._next_buffer = 0
+        self._lock = threading.Lock()
+        self._latest: Any | None = None
+        self._frame_wanted = threading.Event()
+        self._frame_wanted.set()
+        self._stop_event = threading.Event()
+        self.error: CameraError | None = None
+        self.frames_dropped = 0
+
+    def run(self) -> None:
+        grab = self._capture.grab
+        retrieve = self._capture.retrieve
+        stop_requested = self._stop_event.is_set
+        frame_wanted = self._frame_wanted
+        lock = self._lock
+        buffers = self._buffers
+        clock = self._clock
+        frame_interval = self._frame_interval
+        # Estimated from the time between grab() returns, starting from the
+        # requested rate until the source has delivered a few frames.
+        measured_interval = 1.0 / CAPTURE_FPS
+        idle_since = clock()
+        last_grabbed_at: float | None = None
+        next_grab_due = idle_since
+        while not stop_requested():
+            if frame_interval is not None:
+                delay = next_grab_due - clock()
+                if delay > 0 and self._stop_event.wait(delay):
+                    return
+                next_grab_due = max(next_grab_due + frame_interval, clock())
+
+            grab_started = clock()
+            if not grab():
+                self.error = CameraError("Failed to read frame from camera source.")
+                return
+            grabbed_at = clock()
+
+            # The time since the loop was last waiting on the camera or
+            # decoding, i.e. how long it was stalled. A grab that then returns
+            # at once handed out a frame queued during the stall; skip the
+            # queued frames instead of decoding the past.
+            if (
+                frame_interval is None
+                and grab_started - idle_since
+                > STALE_FRAME_GAP_PERIODS * measured_interval
+                and grabbed_at - grab_started
+                < FRESH_GRAB_MIN_PERIODS * measured_interval
+            ):
+                drained_at = self._drain_stale_frames(
+                    grab, clock, FRESH_GRAB_MIN_PERIODS * measured_interval
+                )
+                if drained_at is None:
+                    self.error = CameraError("Failed to read frame from camera source.")
+                    return
+                grabbed_at = drained_at
+            elif last_grabbed_at is not None:
+                measured_interval += FRAME_INTERVAL_SMOOTHING * (
+                    grabbed_at - last_grabbed_at - measured_interval
+                )
+            last_grabbed_at = idle_since = grabbed_at
+
+            if not frame_wanted.is_set():
+                continue
+            frame_wanted.clear()
+
+            ok, frame = retrieve(buffers[self._next_buffer])
+            if not ok:
+                self.error = CameraError("Failed to read frame from camera source.")
+                return
+            idle_since = clock()
+            buffers[self._next_buffer] = frame
+            self._next_buffer ^= 1
+            with lock:
+                self._latest = frame
+
+    def _drain_stale_frames(
+        self,
+        grab: Callable[[], bool],
+        clock: Callable[[], float],
+        fresh_grab_min: float,
+    ) -> float | None:
+        # Queued frames are handed out immediately; stop at the first grab
+        # that had to wait for the camera. Returns when that grab returned,
+        # or None if a grab failed.
+        for dropped in range(1, MAX_STALE_GRABS + 1):
+            grab_started = clock()
+            if not grab():
+                return None
+            grabbed_at = clock()
+            if grabbed_at - grab_started >= fresh_grab_min:
+                break
+        self.frames_dropped += dropped
+        return grabbed_at
+
+    def take(self) -> Any | None:
+        with self._lock:
+            frame, self._latest = self._latest, None
+        if frame is None:
+            if self.error is not None:
+                raise self.error
+            self._frame_wanted.set()
+        return frame
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self.is_alive():
+            self.join()
+
+
+def _playback_interval(
+    source: int | str, capture: Any, cv2_module: Any
+) -> float | None:
+    if not (isinstance(source, str) and os.path.isfile(source)):
+        return None
+
+    fps = 0.0
+    fps_id = _resolve_prop_ids(cv2_module, ("CAP_PROP_FPS",)).get("CAP_PROP_FPS")
+    get_property = getattr(capture, "get", None)
+    if fps_id is not None and get_property is not None:
+        try:
+            raw_value = get_property(fps_id)
+            if isinstance(raw_value, (int, float)):
+                fps = float(raw_value)
+        except Exception:
+            fps = 0.0
+    return 1.0 / (fps if fps > 0 else CAPTURE_FPS)
+
+
+def make_frame_display(cv2_module: Any, raw: bool) -> Callable[[Any], None]:
+    imshow = cv2_module.imshow
+    if not raw:
+        return lambda frame: imshow(WINDOW_NAME, frame)
+
+    imdecode = cv2_module.imdecode
+    decode_flags = cv2_module.IMREAD_COLOR
+
+    warned = False
+
+    def display_raw_frame(frame: Any) -> None:
+        nonlocal warned
+        decoded = imdecode(frame, decode_flags)
+        if decoded is not None:
+            imshow(WINDOW_NAME, decoded)
+        elif not warned:
+            warned = True
+            logger.warning(
+                "Could not decode a raw frame; the camera may not be delivering "
+                "MJPG. Run without --no-convert-rgb to display it."
+            )
+
+    return display_raw_frame
 
 
 def run(
@@ -154,23 +517,52 @@ def run(
     cv2_module: Any,
 ) -> None:
     source = normalize_camera_source(args.camera_source)
-    capture = None
     first_frame = None
+    raw_frames = False
     failure_reasons: list[str] = []
     mode_specs = [
-        ("requested defaults", True),
-        ("driver defaults", False),
+        ("requested defaults", "apply"),
+        ("driver defaults", "reset"),
+        ("reopened capture", "reopen"),
     ]
 
-    for mode_name, apply_defaults in mode_specs:
-        candidate_capture = open_capture(source, cv2_module)
-        try:
-            if apply_defaults:
-                apply_capture_defaults(candidate_capture, cv2_module)
-
-            ok, frame = read_initial_frame(candidate_capture)
+    # Only camera backends take the defaults at open time; FFMPEG rejects
+    # unused open parameters, which would cost files and streams a reopen.
+    open_params = capture_default_params(cv2_module) if is_camera_device(source) else []
+    capture, params_applied = open_capture_with_params(source, cv2_module, open_params)
+    try:
+        # Driver values can only be snapshotted if the defaults were not
+        # already handed to the backend at open time.
+        driver_properties = (
+            {} if params_applied else read_capture_properties(capture, cv2_module)
+        )
+        for mode_name, action in mode_specs:
+            # Raw frames are only MJPG (and thus decodable with imdecode) while
+            # the requested defaults are in effect.
+            raw_frames = args.no_convert_rgb and action == "apply"
+            if action == "apply":
+                if not params_applied:
+                    apply_capture_defaults(capture, cv2_module)
+                if raw_frames:
+                    set_capture_property(
+                        capture, cv2_module, "CAP_PROP_CONVERT_RGB", 0.0
+                    )
+            elif action == "reset":
+                # Without a snapshot of the driver values there is nothing to
+                # restore in place, so fall through to reopening the capture.
+                if not driver_properties:
+                    continue
+                reset_capture_properties(capture, cv2_module, driver_properties)
+                if args.no_convert_rgb:
+                    set_capture_property(
+                        capture, cv2_module, "CAP_PROP_CONVERT_RGB", 1.0
+                    )
+            else:
+                capture.release()
+                capture = open_capture(source, cv2_module)
+
+            ok, frame = read_initial_frame(capture)
             if ok:
-                capture = candidate_capture
                 first_frame = frame
                 break
 
@@ -180,53 +572,113 @@ def run(
                     f"{STARTUP_READ_ATTEMPTS} attempts"
                 )
             )
-            print(
-                f"Warning: {mode_name} failed to read an initial frame; retrying.",
-                file=sys.stderr,
-            )
-        finally:
-            if capture is not candidate_capture:
-                candidate_capture.release()
+            logger.warning("%s failed to read an initial frame; retrying.", mode_name)
+    finally:
+        if first_frame is None:
+            capture.release()
 
-    if capture is None or first_frame is None:
+    if first_frame is None:
         details = f" ({'; '.join(failure_reasons)})" if failure_reasons else ""
         raise CameraError(f"Failed to read frame from camera source.{details}")
 
+    reader = _CaptureThread(
+        capture, first_frame, _playback_interval(source, capture, cv2_module)
+    )
     try:
-        window_flags = getattr(cv2_module, "WINDOW_NORMAL", 0)
-        cv2_module.namedWindow(WINDOW_NAME, window_flags)
-        if hasattr(cv2_module, "resizeWindow"):
-            cv2_module.resizeWindow(
-                WINDOW_NAME,
-                WINDOW_DEFAULT_WIDTH,
-                WINDOW_DEFAULT_HEIGHT,
-            )
+        if args.headless:
+            _consume_frames(reader, args.max_frames)
+        else:
+            _display_frames(reader, first_frame, cv2_module, raw_frames, args)
+    finally:
+        reader.stop()
+        capture.release()
+        if not args.headless:
+            cv2_module.destroyAllWindows()
 
-        frame = first_frame
-        while True:
-            cv2_module.imshow(WINDOW_NAME, frame)
 
-            key = cv2_module.waitKey(1) & 0xFF
-            if key == ord("q"):
-                break
+@functools.cache
+def _window_settings(cv2_module: Any) -> tuple[int, bool]:
+    return getattr(cv2_module, "WINDOW_NORMAL", 0), hasattr(cv2_module, "resizeWindow")
 
-            ok, frame = capture.read()
-            if not ok:
-                raise CameraError("Failed to read frame from camera source.")
+
+def _display_frames(
+    reader: _CaptureThread,
+    first_frame: Any,
+    cv2_module: Any,
+    raw_frames: bool,
+    args: argparse.Namespace,
+) -> None:
+    window_flags, has_resize_window = _window_settings(cv2_module)
+    cv2_module.namedWindow(WINDOW_NAME, window_flags)
+    if has_resize_window:
+        cv2_module.resizeWindow(
+            WINDOW_NAME,
+            WINDOW_DEFAULT_WIDTH,
+            WINDOW_DEFAULT_HEIGHT,
+        )
+
+    # pollKey() returns immediately, unlike waitKey(1) which can sleep for
+    # a full scheduler tick (~15 ms on Windows).
+    wait_key = cv2_module.waitKey
+    poll_key = getattr(cv2_module, "pollKey", None) or (lambda: wait_key(1))
+    display_frame = make_frame_display(cv2_module, raw_frames)
+    take_frame = reader.take
+    max_frames = args.max_frames
+
+    display_frame(first_frame)
+    reader.start()
+    frames_read = 0
+    while max_frames is None or frames_read < max_frames:
+        if poll_key() & 0xFF == _QUIT_KEY:
+            break
+
+        frame = take_frame()
+        if frame is None:
+            time.sleep(IDLE_POLL_DELAY_SECONDS)
+            continue
+        frames_read += 1
+        display_frame(frame)
+
+
+def _consume_frames(reader: _CaptureThread, max_frames: int | None) -> None:
+    take_frame = reader.take
+    started = time.monotonic()
+    reader.start()
+    frames_read = 0
+    try:
+        while max_frames is None or frames_read < max_frames:
+            if take_frame() is None:
+                time.sleep(IDLE_POLL_DELAY_SECONDS)
+                continue
+            frames_read += 1
     finally:
-        capture.release()
-        cv2_module.destroyAllWindows()
+        elapsed = time.monotonic() - started
+        fps = frames_read / elapsed if elapsed > 0 else 0.0
+        print(
+            f"Read {frames_read} frames in {elapsed:.2f}s ({fps:.1f} FPS, "
+            f"{reader.frames_dropped} stale frames dropped)."
+        )
+
+
+class _CliFormatter(logging.Formatter):
+    """Prefixes messages as "Warning: ..." / "Error: ..." for the CLI."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        return f"{record.levelname.capitalize()}: {super().format(record)}"
 
 
 def main(argv: list[str] | None = None) -> int:
     args = parse_args(argv)
+    handler = logging.StreamHandler()
+    handler.setFormatter(_CliFormatter())
+    logging.basicConfig(level=logging.WARNING, handlers=[handler])
 
     try:
         import cv2
 
         run(args, cv2)
     except CameraError as exc:
-        print(f"Error: {exc}", file=sys.stderr)
+        logger.error("%s", exc)
         return 1
 
     return 0
@@ -1,6 +1,6 @@
 from types import SimpleNamespace
 
-from inno.main import CameraError, open_capture
+from inno.main import CameraError, open_capture, open_capture_with_params
 
 
 class FakeCapture:
@@ -19,12 +19,43 @@ class FakeCV2:
     def __init__(self, success_target: tuple[object, int | None]) -> None:
         self.success_target = success_target
         self.calls: list[tuple[object, int | None]] = []
-
-    def VideoCapture(self, source: object, backend: int | None = None) -> FakeCapture:
+        self.params_calls: list[list[int] | None] = []
+
+    def VideoCapture(
+        self,
+        source: object,
+        backend: int | None = None,
+        params: list[int] | None = None,
+    ) -> FakeCapture:
         self.calls.append((source, backend))
+        self.params_calls.append(params)
         return FakeCapture((source, backend) == self.success_target)
 
 
+class FakeCV2WithParams(FakeCV2):
+    CAP_ANY = 0
+
+
+class FakeCV2Error(Exception):
+    pass
+
+
+class FakeCV2RejectingParams(FakeCV2WithParams):
+    error = FakeCV2Error
+
+    def VideoCapture(
+        self,
+        source: object,
+        backend: int | None = None,
+        params: list[int] | None = None,
+    ) -> FakeCapture:
+        if params is not None:
+            self.calls.append((source, backend))
+            self.params_calls.append(params)
+            raise self.error("params overload unavailable")
+        return super().VideoCapture(source, backend)
+
+
 def test_open_capture_uses_default_backend() -> None:
     cv2 = FakeCV2(success_target=(0, None))
 
@@ -54,3 +85,79 @@ def test_open_capture_raises_with_attempt_list() -> None:
         assert "default" in message
     else:
         raise AssertionError("Expected CameraError")
+
+
+def test_open_capture_reports_missing_device_path() -> None:
+    cv2 = FakeCV2(success_target=("never", None))
+
+    try:
+        open_capture("/dev/video999", cv2)
+    except CameraError as exc:
+        assert "Device path does not exist." in str(exc)
+    else:
+        raise AssertionError("Expected CameraError")
+
+
+def test_open_capture_with_params_passes_params_to_backend() -> None:
+    cv2 = FakeCV2WithParams(success_target=(0, 0))
+
+    capture, params_applied = open_capture_with_params(0, cv2, [3, 1920])
+
+    assert capture.isOpened()
+    assert params_applied
+    assert cv2.calls == [(0, 0)]
+    assert cv2.params_calls == [[3, 1920]]
+
+
+def test_open_capture_with_params_falls_back_without_params_support() -> None:
+    cv2 = FakeCV2(success_target=(0, None))
+
+    capture, params_applied = open_capture_with_params(0, cv2, [3, 1920])
+
+    assert capture.isOpened()
+    assert not params_applied
+    assert cv2.params_calls == [None]
+
+
+def test_open_capture_with_params_falls_back_when_params_rejected() -> None:
+    cv2 = FakeCV2WithParams(success_target=(0, None))
+
+    capture, params_applied = open_capture_with_params(0, cv2, [3, 1920])
+
+    assert capture.isOpened()
+    assert not params_applied
+    assert cv2.calls == [(0, 0), (0, None)]
+    assert cv2.params_calls == [[3, 1920], None]
+
+
+def test_open_capture_with_params_falls_back_per_candidate_on_cv2_error() -> None:
+    cv2 = FakeCV2RejectingParams(success_target=("/dev/video0", None))
+
+    capture, params_applied = open_capture_with_params(0, cv2, [3, 1920])
+
+    assert capture.isOpened()
+    assert not params_applied
+    assert cv2.calls == [(0, 0), (0, None), ("/dev/video0", 0), ("/dev/video0", None)]
+
+
+def test_open_capture_with_params_propagates_unrelated_errors() -> None:
+    cv2 = FakeCV2WithParams(success_target=(0, 0))
+    cv2.VideoCapture = lambda *_args: 1 / 0
+
+    try:
+        open_capture_with_params(0, cv2, [3, 1920])
+    except ZeroDivisionError:
+        pass
+    else:
+        raise AssertionError("Expected ZeroDivisionError")
+
+
+def test_open_capture_with_params_lists_params_attempts() -> None:
+    cv2 = FakeCV2WithParams(success_target=("never", None))
+
+    try:
+        open_capture_with_params(0, cv2, [3, 1920])
+    except CameraError as exc:
+        assert "Tried: default+params, default, dev-path+params, dev-path." in str(exc)
+    else:
+        raise AssertionError("Expected CameraError")
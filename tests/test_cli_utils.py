@@ -1,6 +1,13 @@
+import logging
+
 import pytest
 
-from inno.main import normalize_camera_source, parse_args
+from inno.main import (
+    _CliFormatter,
+    is_camera_device,
+    normalize_camera_source,
+    parse_args,
+)
 
 
 def test_camera_source_numeric_string_to_int() -> None:
@@ -12,6 +19,25 @@ def test_camera_source_dev_video_path_to_index() -> None:
     assert normalize_camera_source(source) == 0
 
 
+def test_camera_source_keeps_paths_and_urls() -> None:
+    assert normalize_camera_source(" /dev/video1x ") == "/dev/video1x"
+    assert normalize_camera_source("rtsp://cam/1") == "rtsp://cam/1"
+
+
+def test_camera_device_sources() -> None:
+    assert is_camera_device(0)
+    assert is_camera_device("/dev/video1x")
+    assert not is_camera_device("rtsp://cam/1")
+    assert not is_camera_device("clip.mp4")
+
+
+def test_cli_formatter_keeps_capitalized_prefixes() -> None:
+    record = logging.LogRecord(
+        "inno.main", logging.WARNING, __file__, 1, "ignored %s", ("FPS",), None
+    )
+    assert _CliFormatter().format(record) == "Warning: ignored FPS"
+
+
 def test_parse_args_custom_source() -> None:
     args = parse_args(["--camera-source", "1"])
     assert args.camera_source == "1"
@@ -22,6 +48,23 @@ def test_parse_args_default_source_is_index_0() -> None:
     assert args.camera_source == "0"
 
 
+def test_parse_args_convert_rgb_enabled_by_default() -> None:
+    assert parse_args([]).no_convert_rgb is False
+    assert parse_args(["--no-convert-rgb"]).no_convert_rgb is True
+
+
+def test_parse_args_headless_benchmark_flags() -> None:
+    args = parse_args(["--headless", "--max-frames", "100"])
+    assert args.headless is True
+    assert args.max_frames == 100
+    assert parse_args([]).max_frames is None
+
+
+def test_parse_args_rejects_non_positive_max_frames() -> None:
+    with pytest.raises(SystemExit):
+        parse_args(["--max-frames", "0"])
+
+
 def test_parse_args_rejects_unknown_flag() -> None:
     with pytest.raises(SystemExit):
         parse_args(["--unsupported-flag", "123"])
@@ -1,28 +1,52 @@
-import argparse
 import importlib
+import logging
+import time
+
+import pytest
 
 app_main = importlib.import_module("inno.main")
 
 
 class FakeCapture:
-    def __init__(self, first_read_ok: bool = True, fail_reads: int = 0) -> None:
+    def __init__(
+        self,
+        first_read_ok: bool = True,
+        fail_reads: int = 0,
+        max_grabs: int | None = None,
+        properties: dict[int, float] | None = None,
+    ) -> None:
         self.set_calls: list[tuple[int, float]] = []
+        self.properties = dict(properties or {})
         self.released = False
         self._first_read_ok = first_read_ok
         self._fail_reads = fail_reads
-        self._read_count = 0
+        self._max_grabs = max_grabs
+        self._grab_count = 0
+        self.retrieve_count = 0
+        self.retrieve_targets: list[object] = []
 
     def set(self, prop_id: int, prop_value: float) -> bool:
         self.set_calls.append((prop_id, prop_value))
+        self.properties[prop_id] = prop_value
         return True
 
-    def read(self) -> tuple[bool, object]:
-        self._read_count += 1
-        if self._read_count <= self._fail_reads:
-            return False, object()
-        if self._read_count == 1 and not self._first_read_ok:
-            return False, object()
-        return True, object()
+    def get(self, prop_id: int) -> float:
+        return self.properties.get(prop_id, 0.0)
+
+    def grab(self) -> bool:
+        if self._max_grabs is not None and self._grab_count >= self._max_grabs:
+            return False
+        self._grab_count += 1
+        if self._grab_count <= self._fail_reads:
+            return False
+        if self._grab_count == 1 and not self._first_read_ok:
+            return False
+        return True
+
+    def retrieve(self, image: object = None) -> tuple[bool, object]:
+        self.retrieve_count += 1
+        self.retrieve_targets.append(image)
+        return True, ("frame", self._grab_count) if image is None else image
 
     def release(self) -> None:
         self.released = True
@@ -33,17 +57,19 @@ class FakeCV2:
     CAP_PROP_FRAME_HEIGHT = 4
     CAP_PROP_FPS = 5
     CAP_PROP_FOURCC = 6
+    CAP_PROP_BUFFERSIZE = 38
+    CAP_PROP_CONVERT_RGB = 16
+    IMREAD_COLOR = 1
     WINDOW_NORMAL = 0
     WINDOW_AUTOSIZE = 1
 
-    def __init__(self) -> None:
+    def __init__(self, keys: list[int] | None = None) -> None:
         self.capture = FakeCapture()
         self.named_window_calls: list[tuple[str, int]] = []
         self.resize_calls: list[tuple[str, int, int]] = []
-
-    def VideoWriter_fourcc(self, *chars: str) -> int:
-        assert chars == tuple("MJPG")
-        return 1196444237
+        self.shown_frames: list[object] = []
+        self.wait_key_delays: list[int] = []
+        self._keys = iter(keys or [])
 
     def namedWindow(self, name: str, flags: int) -> None:
         self.named_window_calls.append((name, flags))
@@ -51,18 +77,25 @@ class FakeCV2:
     def resizeWindow(self, name: str, width: int, height: int) -> None:
         self.resize_calls.append((name, width, height))
 
-    def imshow(self, _name: str, _frame: object) -> None:
-        return None
+    def imdecode(self, buf: object, flags: int) -> tuple[str, object, int]:
+        return ("decoded", buf, flags)
+
+    def imshow(self, _name: str, frame: object) -> None:
+        self.shown_frames.append(frame)
+
+    def pollKey(self) -> int:
+        return next(self._keys, ord("q"))
 
-    def waitKey(self, _delay: int) -> int:
-        return ord("q")
+    def waitKey(self, delay: int) -> int:
+        self.wait_key_delays.append(delay)
+        return next(self._keys, ord("q"))
 
     def destroyAllWindows(self) -> None:
         return None
 
 
 def test_run_sets_fixed_capture_defaults(monkeypatch) -> None:
-    args = argparse.Namespace(camera_source="0")
+    args = app_main.parse_args([])
     cv2 = FakeCV2()
     monkeypatch.setattr(app_main, "open_capture", lambda _source, _cv2: cv2.capture)
 
@@ -72,18 +105,110 @@ def test_run_sets_fixed_capture_defaults(monkeypatch) -> None:
         (cv2.CAP_PROP_FRAME_WIDTH, 1920.0),
         (cv2.CAP_PROP_FRAME_HEIGHT, 1080.0),
         (cv2.CAP_PROP_FPS, 30.0),
-        (cv2.CAP_PROP_FOURCC, 1196444237.0),
+        (cv2.CAP_PROP_BUFFERSIZE, 1.0),
+        (cv2.CAP_PROP_FOURCC, float(app_main._MJPG_FOURCC)),
     ]
     assert cv2.named_window_calls == [(app_main.WINDOW_NAME, cv2.WINDOW_NORMAL)]
     assert cv2.resize_calls == [(app_main.WINDOW_NAME, 1280, 720)]
     assert cv2.capture.released
 
 
+def test_run_passes_capture_defaults_as_open_params(monkeypatch) -> None:
+    args = app_main.parse_args([])
+    cv2 = FakeCV2()
+    cv2.CAP_ANY = 0
+    open_params: list[object] = []
+
+    def fake_open_capture_with_params(
+        _source: object, _cv2: object, params: list[int]
+    ) -> tuple[FakeCapture, bool]:
+        open_params.append(params)
+        return cv2.capture, True
+
+    monkeypatch.setattr(
+        app_main, "open_capture_with_params", fake_open_capture_with_params
+    )
+
+    app_main.run(args, cv2)
+
+    assert open_params == [
+        [
+            cv2.CAP_PROP_FRAME_WIDTH,
+            1920,
+            cv2.CAP_PROP_FRAME_HEIGHT,
+            1080,
+            cv2.CAP_PROP_FPS,
+            30,
+            cv2.CAP_PROP_BUFFERSIZE,
+            1,
+            cv2.CAP_PROP_FOURCC,
+            app_main._MJPG_FOURCC,
+        ]
+    ]
+    assert cv2.capture.set_calls == []
+
+
+def test_run_opens_streams_without_open_params(monkeypatch) -> None:
+    args = app_main.parse_args(["--camera-source", "rtsp://cam/1"])
+    cv2 = FakeCV2()
+    cv2.CAP_ANY = 0
+    open_calls: list[object] = []
+
+    def fake_open_capture(source: object, _cv2: object) -> FakeCapture:
+        open_calls.append(source)
+        return cv2.capture
+
+    monkeypatch.setattr(app_main, "open_capture", fake_open_capture)
+
+    app_main.run(args, cv2)
+
+    assert open_calls == ["rtsp://cam/1"]
+    assert cv2.capture.set_calls == [
+        (cv2.CAP_PROP_FRAME_WIDTH, 1920.0),
+        (cv2.CAP_PROP_FRAME_HEIGHT, 1080.0),
+        (cv2.CAP_PROP_FPS, 30.0),
+        (cv2.CAP_PROP_BUFFERSIZE, 1.0),
+        (cv2.CAP_PROP_FOURCC, float(app_main._MJPG_FOURCC)),
+    ]
+
+
+def test_run_reopens_capture_when_read_fails_after_open_params(
+    monkeypatch, caplog
+) -> None:
+    args = app_main.parse_args([])
+    cv2 = FakeCV2()
+    monkeypatch.setattr(app_main, "STARTUP_READ_ATTEMPTS", 3)
+    monkeypatch.setattr(app_main, "_startup_delay", lambda _attempt: 0.0)
+    capture_with_params = FakeCapture(fail_reads=3)
+    reopened_capture = FakeCapture()
+    monkeypatch.setattr(
+        app_main,
+        "open_capture_with_params",
+        lambda _source, _cv2, _params: (capture_with_params, True),
+    )
+    monkeypatch.setattr(
+        app_main, "open_capture", lambda _source, _cv2: reopened_capture
+    )
+
+    with caplog.at_level(logging.WARNING, logger="inno.main"):
+        app_main.run(args, cv2)
+
+    # No driver snapshot exists, so nothing is restored in place.
+    assert capture_with_params.set_calls == []
+    assert capture_with_params.released
+    assert reopened_capture.set_calls == []
+    assert reopened_capture.retrieve_count >= 1
+    assert reopened_capture.released
+    assert caplog.messages == [
+        "requested defaults failed to read an initial frame; retrying."
+    ]
+
+
 def test_run_retries_with_driver_defaults_when_initial_read_fails(monkeypatch) -> None:
-    args = argparse.Namespace(camera_source="0")
+    args = app_main.parse_args([])
     cv2 = FakeCV2()
     monkeypatch.setattr(app_main, "STARTUP_READ_ATTEMPTS", 3)
-    monkeypatch.setattr(app_main, "STARTUP_READ_DELAY_SECONDS", 0.0)
+    monkeypatch.setattr(app_main, "_startup_delay", lambda _attempt: 0.0)
     capture_with_defaults = FakeCapture(fail_reads=3)
     capture_with_driver_defaults = FakeCapture(first_read_ok=True)
     captures = iter([capture_with_defaults, capture_with_driver_defaults])
@@ -95,10 +220,337 @@ def test_run_retries_with_driver_defaults_when_initial_read_fails(monkeypatch) -
         (cv2.CAP_PROP_FRAME_WIDTH, 1920.0),
         (cv2.CAP_PROP_FRAME_HEIGHT, 1080.0),
         (cv2.CAP_PROP_FPS, 30.0),
-        (cv2.CAP_PROP_FOURCC, 1196444237.0),
+        (cv2.CAP_PROP_BUFFERSIZE, 1.0),
+        (cv2.CAP_PROP_FOURCC, float(app_main._MJPG_FOURCC)),
     ]
     assert cv2.named_window_calls == [(app_main.WINDOW_NAME, cv2.WINDOW_NORMAL)]
     assert cv2.resize_calls == [(app_main.WINDOW_NAME, 1280, 720)]
     assert capture_with_driver_defaults.set_calls == []
     assert capture_with_defaults.released
     assert capture_with_driver_defaults.released
+
+
+def test_run_resets_driver_defaults_in_place_when_initial_read_fails(
+    monkeypatch,
+) -> None:
+    args = app_main.parse_args([])
+    cv2 = FakeCV2()
+    monkeypatch.setattr(app_main, "STARTUP_READ_ATTEMPTS", 3)
+    monkeypatch.setattr(app_main, "_startup_delay", lambda _attempt: 0.0)
+    capture = FakeCapture(
+        fail_reads=3,
+        properties={cv2.CAP_PROP_FRAME_WIDTH: 640.0, cv2.CAP_PROP_FPS: 15.0},
+    )
+    open_calls: list[object] = []
+
+    def fake_open_capture(source: object, _cv2: object) -> FakeCapture:
+        open_calls.append(source)
+        return capture
+
+    monkeypatch.setattr(app_main, "open_capture", fake_open_capture)
+
+    app_main.run(args, cv2)
+
+    assert open_calls == [0]
+    assert capture.set_calls == [
+        (cv2.CAP_PROP_FRAME_WIDTH, 1920.0),
+        (cv2.CAP_PROP_FRAME_HEIGHT, 1080.0),
+        (cv2.CAP_PROP_FPS, 30.0),
+        (cv2.CAP_PROP_BUFFERSIZE, 1.0),
+        (cv2.CAP_PROP_FOURCC, float(app_main._MJPG_FOURCC)),
+        (cv2.CAP_PROP_FRAME_WIDTH, 640.0),
+        (cv2.CAP_PROP_FPS, 15.0),
+    ]
+    assert capture.released
+
+
+def test_set_capture_property_logs_ignored_setting(caplog) -> None:
+    cv2 = FakeCV2()
+    capture = FakeCapture()
+    capture.set = lambda _prop_id, _prop_value: False
+
+    with caplog.at_level(logging.WARNING, logger="inno.main"):
+        app_main.set_capture_property(capture, cv2, "CAP_PROP_FPS", 30.0)
+
+    assert caplog.messages == [
+        "OpenCV ignored default capture setting CAP_PROP_FPS=30.0. (actual=0.0)"
+    ]
+
+
+def test_mjpg_fourcc_matches_opencv_packing() -> None:
+    assert app_main._MJPG_FOURCC == 1196444237
+
+
+def test_startup_delay_backs_off_up_to_one_frame_period() -> None:
+    delays = [app_main._startup_delay(attempt) for attempt in range(7)]
+
+    assert delays[:5] == [0.002, 0.004, 0.008, 0.016, 0.032]
+    assert delays[5:] == [1.0 / app_main.CAPTURE_FPS] * 2
+
+
+def test_capture_thread_only_retrieves_frames_that_are_taken() -> None:
+    capture = FakeCapture(max_grabs=4)
+    reader = app_main._CaptureThread(capture)
+
+    reader.run()
+
+    assert capture._grab_count == 4
+    assert capture.retrieve_count == 1
+    assert reader.take() is not None
+    with pytest.raises(app_main.CameraError):
+        reader.take()
+
+
+def test_capture_thread_decodes_the_grab_after_demand() -> None:
+    capture = FakeCapture(max_grabs=6)
+    reader = app_main._CaptureThread(capture)
+    taken: list[object] = []
+    original_grab = capture.grab
+
+    def grab_and_consume() -> bool:
+        if capture._grab_count == 3:
+            taken.append(reader.take())
+            taken.append(reader.take())
+        return original_grab()
+
+    capture.grab = grab_and_consume
+
+    reader.run()
+
+    assert taken == [("frame", 1), None]
+    assert reader.take() == ("frame", 4)
+    assert capture.retrieve_count == 2
+
+
+def test_capture_thread_reuses_two_frame_buffers() -> None:
+    capture = FakeCapture(max_grabs=9)
+    first_frame = object()
+    reader = app_main._CaptureThread(capture, first_frame)
+    original_grab = capture.grab
+
+    def grab_and_consume() -> bool:
+        reader.take()
+        return original_grab()
+
+    capture.grab = grab_and_consume
+
+    reader.run()
+
+    allocated = capture.retrieve_targets[2]
+    assert capture.retrieve_targets == [
+        None,
+        first_frame,
+        allocated,
+        first_frame,
+        allocated,
+    ]
+
+
+class SimulatedCamera:
+    """Delivers a frame every ``period`` seconds on a fake clock.
+
+    grab() blocks until the next frame unless one is already queued; like a
+    driver with a single buffer, only the newest frame is kept.
+    """
+
+    def __init__(self, capture: FakeCapture, period: float, decode: float = 0.0):
+        self.now = 0.0
+        self.period = period
+        self.decode = decode
+        self.frames_grabbed: list[int] = []
+        self._last_frame = -1
+        self._grab = capture.grab
+        self._retrieve = capture.retrieve
+        capture.grab = self.grab
+        capture.retrieve = self.retrieve
+
+    def clock(self) -> float:
+        return self.now
+
+    def grab(self) -> bool:
+        newest = int(self.now / self.period + 1e-9)
+        if newest > self._last_frame:
+            self._last_frame = newest
+        else:
+            self._last_frame += 1
+            self.now = self._last_frame * self.period
+        if not self._grab():
+            return False
+        self.frames_grabbed.append(self._last_frame)
+        return True
+
+    def retrieve(self, image: object = None) -> tuple[bool, object]:
+        self.now += self.decode
+        return self._retrieve(image)
+
+
+def _take_before_each_grab(
+    reader: app_main._CaptureThread, camera: SimulatedCamera
+) -> list[object]:
+    taken: list[object] = []
+    grab = camera.grab
+
+    def take_and_grab() -> bool:
+        frame = reader.take()
+        if frame is not None:
+            taken.append(frame)
+        return grab()
+
+    reader._capture.grab = take_and_grab
+    return taken
+
+
+def test_capture_thread_keeps_every_frame_of_a_slow_source() -> None:
+    capture = FakeCapture(max_grabs=20)
+    camera = SimulatedCamera(capture, period=1.0 / 15)
+    reader = app_main._CaptureThread(capture, clock=camera.clock)
+    taken = _take_before_each_grab(reader, camera)
+
+    reader.run()
+
+    assert reader.frames_dropped == 0
+    assert camera.frames_grabbed == list(range(20))
+    assert len(taken) == capture.retrieve_count == 10
+
+
+def test_capture_thread_keeps_frames_when_decode_exceeds_half_a_period() -> None:
+    capture = FakeCapture(max_grabs=20)
+    camera = SimulatedCamera(capture, period=1.0 / 30, decode=0.025)
+    reader = app_main._CaptureThread(capture, clock=camera.clock)
+    taken = _take_before_each_grab(reader, camera)
+
+    reader.run()
+
+    assert reader.frames_dropped == 0
+    assert camera.frames_grabbed == list(range(20))
+    assert len(taken) == capture.retrieve_count == 10
+
+
+def test_capture_thread_skips_frames_queued_during_a_stall() -> None:
+    capture = FakeCapture(max_grabs=6)
+    camera = SimulatedCamera(capture, period=1.0 / 30)
+    reader = app_main._CaptureThread(capture, clock=camera.clock)
+    stop_requested = reader._stop_event.is_set
+    loops = [0]
+
+    def stall_before_fourth_grab() -> bool:
+        loops[0] += 1
+        if loops[0] == 4:
+            camera.now += 0.2
+        return stop_requested()
+
+    reader._stop_event.is_set = stall_before_fourth_grab
+
+    reader.run()
+
+    assert reader.frames_dropped == 1
+    assert camera.frames_grabbed == [0, 1, 2, 8, 9, 10]
+    assert capture.retrieve_count == 1
+
+
+def test_run_shows_frames_from_capture_thread(monkeypatch) -> None:
+    args = app_main.parse_args([])
+    cv2 = FakeCV2()
+    deadline = time.monotonic() + 5.0
+    cv2.pollKey = lambda: (
+        ord("q") if len(cv2.shown_frames) >= 3 or time.monotonic() > deadline else -1
+    )
+    monkeypatch.setattr(app_main, "open_capture", lambda _source, _cv2: cv2.capture)
+
+    app_main.run(args, cv2)
+
+    assert len(cv2.shown_frames) == 3
+    assert cv2.wait_key_delays == []
+    assert cv2.capture.released
+
+
+def test_run_paces_video_files_with_non_blocking_grab(monkeypatch, tmp_path) -> None:
+    video_path = tmp_path / "clip.mp4"
+    video_path.write_bytes(b"")
+    args = app_main.parse_args(["--camera-source", str(video_path)])
+    cv2 = FakeCV2()
+    cv2.capture = FakeCapture(max_grabs=300, properties={cv2.CAP_PROP_FPS: 200.0})
+    # File backends ignore the requested capture defaults.
+    cv2.capture.set = lambda _prop_id, _prop_value: True
+    deadline = time.monotonic() + 5.0
+    cv2.pollKey = lambda: (
+        ord("q") if len(cv2.shown_frames) >= 10 or time.monotonic() > deadline else -1
+    )
+    monkeypatch.setattr(app_main, "open_capture", lambda _source, _cv2: cv2.capture)
+
+    app_main.run(args, cv2)
+
+    assert len(cv2.shown_frames) == 10
+    assert cv2.capture._grab_count < 300
+
+
+def test_run_no_convert_rgb_decodes_shown_frames(monkeypatch) -> None:
+    args = app_main.parse_args(["--no-convert-rgb"])
+    cv2 = FakeCV2()
+    monkeypatch.setattr(app_main, "open_capture", lambda _source, _cv2: cv2.capture)
+
+    app_main.run(args, cv2)
+
+    assert cv2.capture.set_calls[-1] == (cv2.CAP_PROP_CONVERT_RGB, 0.0)
+    assert len(cv2.shown_frames) == 1
+    assert cv2.shown_frames[0][0] == "decoded"
+    assert cv2.shown_frames[0][2] == cv2.IMREAD_COLOR
+
+
+def test_run_no_convert_rgb_keeps_conversion_after_driver_default_reopen(
+    monkeypatch,
+) -> None:
+    args = app_main.parse_args(["--no-convert-rgb"])
+    cv2 = FakeCV2()
+    monkeypatch.setattr(app_main, "STARTUP_READ_ATTEMPTS", 3)
+    monkeypatch.setattr(app_main, "_startup_delay", lambda _attempt: 0.0)
+    capture_with_defaults = FakeCapture(fail_reads=3)
+    capture_with_driver_defaults = FakeCapture()
+    captures = iter([capture_with_defaults, capture_with_driver_defaults])
+    monkeypatch.setattr(app_main, "open_capture", lambda _source, _cv2: next(captures))
+
+    app_main.run(args, cv2)
+
+    assert (cv2.CAP_PROP_CONVERT_RGB, 0.0) in capture_with_defaults.set_calls
+    assert capture_with_driver_defaults.set_calls == []
+    assert len(cv2.shown_frames) == 1
+    assert cv2.shown_frames[0][0] == "frame"
+
+
+def test_raw_frame_display_warns_once_when_frames_do_not_decode(caplog) -> None:
+    cv2 = FakeCV2()
+    cv2.imdecode = lambda _buf, _flags: None
+    display_frame = app_main.make_frame_display(cv2, raw=True)
+
+    with caplog.at_level(logging.WARNING, logger="inno.main"):
+        display_frame(object())
+        display_frame(object())
+
+    assert cv2.shown_frames == []
+    assert len(caplog.messages) == 1
+
+
+def test_run_falls_back_to_wait_key_without_poll_key(monkeypatch) -> None:
+    args = app_main.parse_args([])
+    cv2 = FakeCV2(keys=[-1])
+    cv2.pollKey = None
+    monkeypatch.setattr(app_main, "open_capture", lambda _source, _cv2: cv2.capture)
+
+    app_main.run(args, cv2)
+
+    assert cv2.wait_key_delays == [1, 1]
+
+
+def test_run_headless_reads_frames_without_gui(monkeypatch, capsys) -> None:
+    args = app_main.parse_args(["--headless", "--max-frames", "5"])
+    cv2 = FakeCV2()
+    cv2.pollKey = None
+    monkeypatch.setattr(app_main, "open_capture", lambda _source, _cv2: cv2.capture)
+
+    app_main.run(args, cv2)
+
+    assert cv2.named_window_calls == []
+    assert cv2.shown_frames == []
+    assert cv2.wait_key_delays == []
+    assert cv2.capture.released
+    assert capsys.readouterr().out.startswith("Read 5 frames in ")